@@ -462,6 +462,8 @@ class Executer:
 
 class FetchResult(list):
 
+    __slots__ = ()
+
     @property
     def count(self):
         return len(self)
@@ -469,6 +471,8 @@ class FetchResult(list):
 
 class ExecResult:
 
+    __slots__ = ('affected', 'last_id')
+
     def __init__(self, affected, last_id):
         self.affected = affected
         self.last_id = last_id
@@ -6,9 +6,12 @@
 """
 from __future__ import annotations
 
-import warnings
 import re
+import sys
+import warnings
 from copy import deepcopy
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any, Dict, Optional, List, Union, Tuple, Type
 
 from . import db, util, err, types, _builder, _helper
@@ -31,88 +34,101 @@ JOINTYPE = util.adict(
 )
 _TABLENAME_REGEX = re.compile(r'([a-z]|\d)([A-Z])')
 _BUILTIN_MODEL_NAMES = ("ModelBase", "Model")
+_MISSING = object()
+_SQL_ALL = _builder.SQL("*")
 
 
-class ModelType(type):
+def _build_attrs(
+    name: str, bases: Tuple[type, ...], attrs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build the model class attributes, the declared fields are
+    moved into the model table. Field and table names are interned
+    as they are used as lookup keys afterwards.
+    """
 
-    def __new__(cls, name: str, bases: Tuple[type, ...], attrs: dict) -> ModelType:
+    model_fields, model_attrs = {}, {}
+    for attr, field in attrs.items():
+        if isinstance(field, types.FieldBase):
+            field.name = sys.intern(field.name or attr)
+            model_fields[attr] = field
+            model_attrs[field.name] = attr
+    for attr in model_fields:
+        del attrs[attr]
+
+    baseclass = bases[0] if bases else None
+    if baseclass:
+        base_table = deepcopy(baseclass.__table__)
+        if base_table:
+            base_table.fields_dict.update(model_fields)
+            model_fields = base_table.fields_dict
+            base_names = deepcopy(baseclass.__attrs__)
+            base_names.update(model_attrs)
+            model_attrs = base_names
+
+    metaclass = attrs.get('Meta')
+    if not metaclass:
+        baseclass = bases[0] if bases else metaclass
+        metaclass = getattr(baseclass, 'Meta', None)
+
+    indexes = getattr(metaclass, 'indexes', [])
+    if indexes:
+        if not isinstance(indexes, (tuple, list)):
+            raise TypeError("the Table.indexes type must be `tuple` or `list`")
+        for index in indexes:
+            if not isinstance(index, types.IndexBase):
+                raise TypeError(f"invalid index type {index!r}")
+
+    primary = util.adict(auto=False, field=None, attr=None, begin=None)
+    for attr_name, field in model_fields.items():
+        if getattr(field, 'primary_key', None):
+            if primary.field is not None:
+                raise err.DuplicatePKError(
+                    "duplicate primary key found for field "
+                    f"{field.name}"
+                )
+            primary.field = field
+            primary.attr = attr_name
+            if getattr(field, "auto", False):
+                primary.auto = True
+                primary.begin = int(field.auto)
+                if field.name != types.Table.AIPK:
+                    warnings.warn(
+                        "The field name of AUTO_INCREMENT "
+                        "primary key is suggested to use "
+                        f"`id` instead of {field.name}",
+                        err.ProgrammingWarning)
+
+    attrs["__attrs__"] = model_attrs
+    attrs["__table__"] = types.Table(
+        database=getattr(metaclass, "db", None),
+        name=sys.intern(getattr(
+            metaclass, 'name',
+            re.sub(_TABLENAME_REGEX, r'\1_\2', name).lower())),
+        fields_dict=model_fields,
+        primary=primary,
+        indexes=indexes,
+        engine=getattr(metaclass, "engine", None),
+        charset=getattr(metaclass, "charset", None),
+        comment=getattr(metaclass, "comment", None),
+    )
+    return attrs
 
-        def __prepare__():
-            model_fields, model_attrs = {}, {}
-            for attr in attrs.copy():
-                field = attrs[attr]
-                if isinstance(field, types.FieldBase):
-                    field.name = field.name or attr
-                    model_fields[attr] = field
-                    model_attrs[field.name] = attr
-                    attrs.pop(attr)
-
-            baseclass = bases[0] if bases else None
-            if baseclass:
-                base_table = deepcopy(baseclass.__table__)
-                if base_table:
-                    base_table.fields_dict.update(model_fields)
-                    model_fields = base_table.fields_dict
-                    base_names = deepcopy(baseclass.__attrs__)
-                    base_names.update(model_attrs)
-                    model_attrs = base_names
-
-            metaclass = attrs.get('Meta')
-            if not metaclass:
-                baseclass = bases[0] if bases else metaclass
-                metaclass = getattr(baseclass, 'Meta', None)
-
-            indexes = getattr(metaclass, 'indexes', [])
-            if indexes and not isinstance(indexes, (tuple, list)):
-                raise TypeError("the Table.indexes type must be `tuple` or `list`")
-            for index in indexes:
-                if not isinstance(index, types.IndexBase):
-                    raise TypeError(f"invalid index type {index!r}")
-
-            primary = util.adict(auto=False, field=None, attr=None, begin=None)
-            for attr_name, field in model_fields.items():
-                if getattr(field, 'primary_key', None):
-                    if primary.field is not None:
-                        raise err.DuplicatePKError(
-                            "duplicate primary key found for field "
-                            f"{field.name}"
-                        )
-                    primary.field = field
-                    primary.attr = attr_name
-                    if getattr(field, "auto", False):
-                        primary.auto = True
-                        primary.begin = int(field.auto)
-                        if field.name != types.Table.AIPK:
-                            warnings.warn(
-                                "The field name of AUTO_INCREMENT "
-                                "primary key is suggested to use "
-                                f"`id` instead of {field.name}",
-                                err.ProgrammingWarning)
-
-            attrs["__attrs__"] = model_attrs
-            attrs["__table__"] = types.Table(
-                database=getattr(metaclass, "db", None),
-                name=getattr(metaclass, 'name',
-                             re.sub(_TABLENAME_REGEX, r'\1_\2', name).lower()),
-                fields_dict=model_fields,
-                primary=primary,
-                indexes=indexes,
-                engine=getattr(metaclass, "engine", None),
-                charset=getattr(metaclass, "charset", None),
-                comment=getattr(metaclass, "comment", None),
-            )
 
-            return attrs
+class ModelType(type):
 
+    def __new__(cls, name: str, bases: Tuple[type, ...], attrs: dict) -> ModelType:
         attrs['__table__'] = None
         if name not in _BUILTIN_MODEL_NAMES:
-            attrs = __prepare__()
+            attrs = _build_attrs(name, bases, attrs)
 
         return type.__new__(cls, name, bases, attrs)  # type: ignore
 
     def __getattr__(cls, name: str) -> Any:
-        if name in cls.__table__.fields_dict:
-            return cls.__table__.fields_dict[name]
+        table = cls.__dict__.get('__table__')
+        if table is not None:
+            field = table.fields_dict.get(name)
+            if field is not None:
+                return field
 
         raise AttributeError(
             f"'{cls.__name__}' class does not have attribute '{name}'"
@@ -169,7 +185,7 @@ class ModelBase:
             setattr(self, attr, kwargs[attr])
 
     def __repr__(self) -> str:
-        id_ = getattr(self, self.__table__.primary.attr, None)
+        id_ = self.__dict__.get(self.__table__.primary.attr)
         return f"<{self.__class__.__name__} object at {id_}>"
 
     __str__ = __repr__
@@ -177,21 +193,23 @@ class ModelBase:
     def __hash__(self) -> int:
         return hash(self.__table__)
 
-    def __eq__(self, other) -> bool:
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
         return self.__dict__ == other.__dict__
 
     def __setattr__(self, name: str, value: Any) -> None:
         self.__setmodel__(name, value)
 
     def __getattr__(self, name: str) -> Any:
-        try:
-            return self.__dict__[name]
-        except KeyError:
-            if name in self.__table__.fields_dict:
-                return None
-            raise AttributeError(
-                f"'{self.__class__}' object has no attribute '{name}'"
-            )
+        value = self.__dict__.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
+        if name in self.__table__.fields_dict:
+            return None
+        raise AttributeError(
+            f"'{self.__class__}' object has no attribute '{name}'"
+        )
 
     def __bool__(self) -> bool:
         return bool(self.__dict__)
@@ -199,7 +217,8 @@ class ModelBase:
     def __setmodel__(
             self, name: str, value: Any, __load__: bool = False
     ) -> None:
-        f = self.__table__.fields_dict.get(name)
+        table = self.__table__
+        f = table.fields_dict.get(name)
         if not f:
             raise err.NotAllowedError(
                 f"{self.__class__.__name__} object not allowed "
@@ -207,7 +226,7 @@ class ModelBase:
             )
 
         if not __load__:
-            if getattr(f, 'primary_key', None) and getattr(f, 'auto', None):
+            if table.primary.auto and name == table.primary.attr:
                 raise err.NotAllowedError(
                     f"auto field '{f.name}' not allowed to set"
                 )
@@ -217,7 +236,9 @@ class ModelBase:
 
     @property
     def __self__(self) -> Dict[str, Any]:
-        return deepcopy(self.__dict__)
+        # Values are always converted by `FieldBase.py_value` to
+        # immutable python types, so a shallow copy is sufficient.
+        return self.__dict__.copy()
 
 
 class Model(_helper.with_metaclass(ModelType, ModelBase)):  # type: ignore
@@ -538,7 +559,7 @@ class ApiProxy:
         where = by
         if not isinstance(where, types.Expression):
             where = get_table(m).primary.field == where
-        return (await Select([_builder.SQL("*")], [m]).where(where)  # type: ignore
+        return (await Select([_SQL_ALL], [m]).where(where)  # type: ignore
                 .get())
 
     @classmethod
@@ -554,7 +575,7 @@ class ApiProxy:
         if isinstance(where, types.SEQUENCE):
             where = get_table(m).primary.field.in_(by)
         return await (
-            Select(columns or [_builder.SQL("*")], [m]).where(where).all()  # type: ignore
+            Select(columns or [_SQL_ALL], [m]).where(where).all()  # type: ignore
         )
 
     @classmethod
@@ -614,7 +635,7 @@ class ApiProxy:
         cls, m: Type[Model], *columns: types.Column
     ) -> Select:
 
-        return Select(list(columns) or [_builder.SQL("*")], [m])  # type: ignore
+        return Select(list(columns) or [_SQL_ALL], [m])  # type: ignore
 
     @classmethod
     def insert(
@@ -677,13 +698,13 @@ class ApiProxy:
     async def save(cls, mo: Model) -> types.ID:
         """ Save model object to db """
 
-        has_id = False
-        pk_attr = get_table(mo).primary.attr
-        if pk_attr in mo.__self__:
-            has_id = True
+        table = get_table(mo)
+        pk_attr = table.primary.attr
+        row = mo.__self__
+        has_id = pk_attr in row
 
-        row = cls._gen_insert_row(mo, mo.__self__, for_replace=has_id)
-        result = await Replace(get_table(mo), ValuesMatch(row)).do()
+        row = cls._gen_insert_row(mo, row, for_replace=has_id)
+        result = await Replace(table, ValuesMatch(row)).do()
         mo.__setmodel__(
             name=pk_attr,
             value=result.last_id,
@@ -707,7 +728,6 @@ class ApiProxy:
         return ret.affected
 
     @classmethod
-    @util.argschecker(row_data=dict, nullable=False)
     def _gen_insert_row(
         cls,
         m: Type[Model],
@@ -715,10 +735,24 @@ class ApiProxy:
         for_replace: bool = False
     ) -> Dict[str, Any]:
 
+        # Unlike the public ``ApiProxy`` methods, this runs once per row
+        # written, so the ``util.argschecker`` checks are inlined here to
+        # avoid binding the signature on each call. Like the decorator,
+        # they are skipped in optimized mode.
+        if __debug__:
+            if not isinstance(row_data, dict):
+                raise TypeError(
+                    f"argument row_data must be {dict}, now got {type(row_data)}"
+                )
+            if not row_data:
+                raise ValueError("argument row_data cannot be empty")
+
+        table = get_table(m)
+        pk_attr = table.primary.attr
         toinserts = {}
-        for name, field in get_table(m).fields_dict.items():
+        for name, field in table.fields_dict.items():
             # Primary key fields should not be included when not for_replace
-            if name == get_table(m).primary.attr and not for_replace:
+            if name == pk_attr and not for_replace:
                 continue
 
             value = row_data.pop(name, None)
@@ -740,7 +774,7 @@ class ApiProxy:
                 raise ValueError(f'invalid data({value}) for {name}')
 
         for attr in row_data:
-            if not for_replace and attr == get_table(m).primary.attr:
+            if not for_replace and attr == pk_attr:
                 raise err.NotAllowedError(
                     f"auto field {attr!r} not allowed to set"
                 )
@@ -802,36 +836,52 @@ class ApiProxy:
 
 class ValuesMatch(_builder.Node):
 
-    __slots__ = ("_columns", "_params", "_values")
+    __slots__ = ("_template", "_values")
 
     def __init__(
         self, rows: Union[Dict[str, Any], List[Dict[str, Any]]]
     ) -> None:
 
         if isinstance(rows, dict):
-            columns = list(rows.keys())
+            columns = tuple(rows.keys())
             self._values = tuple(rows.values())
         elif isinstance(rows, list):
-            columns = list(rows[0].keys())
-            self._values = tuple([tuple(r.values()) for r in rows])
+            columns = tuple(rows[0].keys())
+            ncolumns = len(columns)
+            if any(len(r) != ncolumns for r in rows):
+                raise ValueError("all rows must have the same columns")
+            if not columns:
+                self._values = tuple(() for _ in rows)
+            else:
+                getter = itemgetter(*columns)
+                try:
+                    if ncolumns == 1:
+                        self._values = tuple([(getter(r),) for r in rows])
+                    else:
+                        self._values = tuple([getter(r) for r in rows])
+                except KeyError:
+                    raise ValueError("all rows must have the same columns")
         else:
             raise ValueError("invalid data unpack to values")
 
-        self._columns, self._params = [], []  # type: List[_builder.Node], List[_builder.Node]
-        for col in columns:
-            self._columns.append(_builder.SQL(col.join("``")))
-            self._params.append(_builder.SQL("%s"))
+        self._template = _values_template(columns)
 
     def __sql__(self, ctx: _builder.Context) -> _builder.Context:
-        ctx.literal(' ').sql(_builder.EnclosedNodeList(self._columns))
-        ctx.literal(
-            " VALUES "
-        ).sql(
-            _builder.EnclosedNodeList(self._params)
-        ).values(self._values)
+        ctx.literal(' ').sql(self._template).values(self._values)
         return ctx
 
 
+@lru_cache()
+def _values_template(columns: Tuple[str, ...]) -> _builder.SQL:
+    """The columns and placeholders of a values clause only depend on
+    the column names, so they are built once for each column set"""
+
+    return _builder.SQL("({}) VALUES ({})".format(
+        ", ".join(col.join("``") for col in columns),
+        ", ".join(["%s"] * len(columns)),
+    ))
+
+
 class Join(_builder.Node):
 
     __slots__ = ('lt', 'rt', 'join_type', '_on')
@@ -1125,10 +1175,13 @@ class Select(BaseQuery):
         wrap = props.pop('wrap', False) is True
         if wrap is True or len(self._models) != self._SINGLE:
             self._rowtype = ROWTYPE.ADICT
-        return Loader(
+        loader = Loader(
             await super().__do__(**props),
             self._models[0], self._aliases, wrap=wrap
-        ).do()
+        )
+        if self._props.get('rows') == self._SINGLE:
+            return loader.one()
+        return loader.many()
 
     async def __getrow__(self) -> Optional[Model]:
         async def sets():
@@ -1436,52 +1489,95 @@ class Loader:
         self._mattrs = get_attrs(self._modelclass)
         self._mfields = get_table(self._modelclass).fields_dict
 
-    def do(self) -> Any:
+    def one(self) -> Union[None, util.adict, Tuple[Any, ...], Model]:
+        if not self._data or not isinstance(self._data, dict):
+            return self._data
+
+        if self._wrap is True:
+            attrs = self._resolve_attrs(self._data)
+            if attrs is not None:
+                self._data = self._convert_to_model(self._data, attrs) or self._data
+        else:
+            self._data = self._convert_type(
+                self._data, self._resolve_columns(self._data)
+            )
+        return self._data
+
+    def many(self) -> db.FetchResult:
         if not self._data:
             return self._data
 
-        if isinstance(self._data, db.FetchResult):
-            if self._wrap is True:
-                for i in range(self._data.count):
-                    mobj = self._convert_to_model(self._data[i])
-                    self._data[i] = mobj or self._data[i]
-            else:
-                for i in range(self._data.count):
-                    self._data[i] = self._convert_type(self._data[i])
-        elif isinstance(self._data, dict):
-            if self._wrap is True:
-                self._data = self._convert_to_model(self._data) or self._data
-            else:
-                self._data = self._convert_type(self._data)
+        # All rows of a result set share the same columns,
+        # so they are resolved only once from the first row
+        if self._wrap is True:
+            attrs = self._resolve_attrs(self._data[0])
+            if attrs is not None:
+                self._data[:] = [
+                    self._convert_to_model(row, attrs) or row
+                    for row in self._data
+                ]
+        else:
+            columns = self._resolve_columns(self._data[0])
+            self._data[:] = [
+                self._convert_type(row, columns) for row in self._data
+            ]
         return self._data
 
-    def _convert_type(
+    def _resolve_attrs(
         self, row: util.adict
-    ) -> util.adict:
-        if isinstance(row, dict):
-            for name in row.copy():
-                if name not in self._mattrs.values():
-                    aname = self._aliases.get(name, name)
-                    rname = self._mattrs.get(aname, aname)
-                    row[rname] = row.pop(name)
-                    name = rname
-
-                f = self._mfields.get(name)
-                if f and not isinstance(row[name], f.py_type):
-                    row[name] = f.py_value(row[name])
-        else:
-            pass
-        return row
+    ) -> Optional[List[Tuple[str, str, types.FieldBase]]]:
+        if not isinstance(row, dict):
+            return None
 
-    def _convert_to_model(self, row: util.adict) -> Optional[Model]:
-        model = self._modelclass()
-        for name, value in row.items():
-            name = self._aliases.get(name, name)
-            name = self._mattrs.get(name)
+        attrs = []
+        for column in row:
+            name = self._mattrs.get(self._aliases.get(column, column))
             if not name:
                 return None
+            attrs.append((column, name, self._mfields[name]))
+        return attrs
+
+    def _resolve_columns(
+        self, row: util.adict
+    ) -> List[Tuple[str, str, Optional[types.FieldBase]]]:
+        if not isinstance(row, dict):
+            return []
+
+        columns = []
+        mattrs = set(self._mattrs.values())
+        for name in row:
+            rname = name
+            if name not in mattrs:
+                aname = self._aliases.get(name, name)
+                rname = self._mattrs.get(aname, aname)
+            columns.append((name, rname, self._mfields.get(rname)))
+        return columns
+
+    def _convert_type(
+        self,
+        row: util.adict,
+        columns: List[Tuple[str, str, Optional[types.FieldBase]]]
+    ) -> util.adict:
+        for name, rname, f in columns:
+            if name != rname:
+                row[rname] = row.pop(name)
+            if f and not isinstance(row[rname], f.py_type):
+                row[rname] = f.py_value(row[rname])
+        return row
+
+    def _convert_to_model(
+        self,
+        row: util.adict,
+        attrs: List[Tuple[str, str, types.FieldBase]]
+    ) -> Optional[Model]:
+        # Rows come from the database, there is nothing for
+        # ``__init__`` and ``__setmodel__`` checks to do, so the
+        # converted values are stored to the object directly
+        model = self._modelclass.__new__(self._modelclass)
+        values = model.__dict__
+        for column, name, f in attrs:
             try:
-                model.__setmodel__(name, value, __load__=True)
+                values[name] = f.py_value(row[column])
             except Exception:  # pylint: disable=broad-except
                 return None
         return model
@@ -1260,6 +1260,24 @@ def test_values():
         assert False, "Should raise ValueError"
     except ValueError:
         pass
+    try:
+        ValuesMatch([{'a': 1, 'b': 2}, {'a': 3}])
+        assert False, "Should raise ValueError"
+    except ValueError:
+        pass
+    try:
+        ValuesMatch([{'a': 1}, {'a': 3, 'b': 4}])
+        assert False, "Should raise ValueError"
+    except ValueError:
+        pass
+    try:
+        ValuesMatch([{'a': 1, 'b': 2}, {'a': 3, 'c': 4}])
+        assert False, "Should raise ValueError"
+    except ValueError:
+        pass
+    query = _builder.parse(ValuesMatch([{}, {}]))
+    assert query.sql == '() VALUES ();'
+    assert query.params == ((), ())
 
 
 def test_model():
@@ -1383,6 +1401,12 @@ def test_model():
         pk = t.Auto()
     assert get_table(TM4).name == 'tm4'
 
+    try:
+        assert Model.name is None
+        assert False, "Should raise AttributeError"
+    except AttributeError as e:
+        assert "'Model' class does not have attribute 'name'" in str(e)
+
     assert repr(User) == "Model<User>"
     assert str(User) == "User"
 
@@ -1410,6 +1434,10 @@ def test_model_instance():
     user1 = User(**userinfo)
     user2 = User(**userinfo)
     assert user1 == user2
+    assert user1 in {user2}
+    assert user1 != People(name='1', gender=1, age=50)
+    assert user1 != 1
+    assert user1 not in [None, {}]
 
     user = User(name='at7h', age=20)
     assert user